@@ -17,30 +17,18 @@ else:
 # Get the dimensions of the image
 rows, cols, channels = img.shape if len(img.shape) == 3 else (img.shape[0], img.shape[1], 1)
 
-# Generate 2D coordinates (x, y)
-x, y = np.meshgrid(range(cols), range(rows))
-
-# Flatten the coordinates
-x_flat = x.flatten()
-y_flat = y.flatten()
-
-# Normalize the image values for color mapping
-img_normalized = img / 255.0
-
-# Flatten the color data (convert to RGB if grayscale)
-if channels == 3:
-    # If RGB image, flatten it directly (will give one color per pixel)
-    color_flat = img_normalized.reshape(-1, 3)
+# Normalize the image values for color mapping; PNGs already load as float in [0, 1]
+if np.issubdtype(img.dtype, np.floating):
+    img_normalized = img
 else:
-    # If grayscale, make it an RGB-like structure
-    color_flat = np.repeat(img_normalized.flatten()[:, np.newaxis], 3, axis=1)
+    img_normalized = img.astype(np.float32) / 255.0
 
-# Ensure that the number of color values matches the number of coordinates
-assert len(x_flat) == len(color_flat), "Mismatch between number of coordinates and colors"
-
-# Create a 2D scatter plot
+# Draw the image directly instead of one scatter marker per pixel
 plt.figure(figsize=(10, 8))
-plt.scatter(x_flat, y_flat, c=color_flat, s=1)
+if channels == 1:
+    plt.imshow(img_normalized, cmap='gray')
+else:
+    plt.imshow(img_normalized)
 
 # Hide the axes for better visualization
 plt.axis('off')
@@ -5,10 +5,28 @@ import matplotlib.pyplot as plt
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
 from sklearn.neighbors import KNeighborsClassifier
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import mean_squared_error, accuracy_score
 import os
 
+# Only the columns the models use are loaded; the numeric ones hold NaNs until the median fill
+USECOLS = ['price', 'bed', 'bath', 'acre_lot', 'house_size', 'status', 'city', 'state']
+DTYPES = {
+    'price': 'float32',
+    'bed': 'float32',
+    'bath': 'float32',
+    'acre_lot': 'float32',
+    'house_size': 'float32',
+    'status': 'category',
+    'city': 'category',
+    'state': 'category',
+}
+
+def preview(path, n):
+    # Read only the first n rows so previews don't depend on the processed frame
+    return pd.read_csv(path, nrows=n)
+
 # Step 1: Check the current working directory
 print("Current Working Directory:", os.getcwd())
 
@@ -23,21 +41,17 @@ if not os.path.exists(file_path):
 
 # Step 3: Read the CSV file
 try:
-    data = pd.read_csv(file_path)
+    data = pd.read_csv(file_path, usecols=USECOLS, dtype=DTYPES, engine='pyarrow')
     print("File loaded successfully.")
 
     # Step 4: Handle missing data
     # Fill missing numeric values with the median of each column
-    numeric_cols = data.select_dtypes(include=[np.number]).columns
-    data[numeric_cols] = data[numeric_cols].fillna(data[numeric_cols].median())
+    data.fillna(data.median(numeric_only=True), inplace=True)
     
-    # Drop 'prev_sold_date' if not needed
-    if 'prev_sold_date' in data.columns:
-        data.drop(columns=['prev_sold_date'], inplace=True)
-
     # Step 5: Encode categorical data (status, city, state) using Label Encoding
-    for column in ['status', 'city', 'state']:
-        data[column] = data[column].astype('category').cat.codes
+    # The columns are parsed as categoricals, so the codes already exist: no factorize/sort pass needed
+    for column in ('status', 'city', 'state'):
+        data[column] = data[column].cat.codes
 
     # Step 6: Feature selection (selecting only the relevant columns)
     X = data[['price', 'bed', 'bath', 'acre_lot', 'house_size']]  # Select numeric features
@@ -46,65 +60,103 @@ try:
     # Step 7: Train-test split
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
 
+    # Float32 copies for the regression: half the memory traffic of the float64 default
+    X_train32 = X_train.to_numpy(dtype=np.float32)
+    X_test32 = X_test.to_numpy(dtype=np.float32)
+    y_train32 = y_train.to_numpy(dtype=np.float32)
+
+    # Fitted models, cached so repeated menu choices don't retrain
+    _models = {}
+
+    def get_linreg():
+        model = _models.get('linreg')
+        if model is None:
+            model = _models['linreg'] = LinearRegression().fit(X_train32, y_train32)
+        return model
+
+    def get_knn():
+        model = _models.get('knn')
+        if model is None:
+            model = KNeighborsClassifier(n_neighbors=5, algorithm='kd_tree', n_jobs=-1)
+            model = _models['knn'] = model.fit(X_train, y_train)
+        return model
+
+    def get_kmeans():
+        model = _models.get('kmeans')
+        if model is None:
+            # Assume 2 clusters for binary classification; scale so no feature dominates the distances
+            model = MiniBatchKMeans(n_clusters=2, batch_size=4096, n_init=3, random_state=42)
+            model = _models['kmeans'] = model.fit(StandardScaler().fit_transform(X.to_numpy(dtype=np.float32)))
+        return model
+
+    # One figure per panel, cleared and redrawn instead of allocating a new figure on every call
+    _figures = {}
+
+    def get_axes(name):
+        fig = _figures.get(name)
+        if fig is None or not plt.fignum_exists(fig.number):
+            fig = _figures[name] = plt.figure(figsize=(10, 5))
+        fig.clf()
+        return fig, fig.add_subplot(111)
+
     def display_data():
         rows_to_display = int(input("How many rows of data would you like to print? "))
-        print(data.head(rows_to_display))
+        print(preview(file_path, rows_to_display))
 
     def linear_regression():
-        linear_reg = LinearRegression()
-        linear_reg.fit(X_train, y_train)
-        y_pred_lin = linear_reg.predict(X_test)
+        linear_reg = get_linreg()
+        y_pred_lin = linear_reg.predict(X_test32)
         mse_lin = mean_squared_error(y_test, y_pred_lin)
         print(f'Linear Regression MSE: {mse_lin}')
 
-        plt.figure(figsize=(10, 5))
-        plt.bar(['MSE'], [mse_lin], color='blue')
-        plt.title('Linear Regression Performance')
-        plt.ylabel('Mean Squared Error')
+        fig, ax = get_axes('linreg')
+        ax.bar(['MSE'], [mse_lin], color='blue')
+        ax.set_title('Linear Regression Performance')
+        ax.set_ylabel('Mean Squared Error')
+        fig.canvas.draw_idle()
         plt.show(block=False)  # Use block=False to prevent blocking the terminal
 
     def knn_classifier():
-        knn = KNeighborsClassifier(n_neighbors=5)
-        knn.fit(X_train, y_train)
+        knn = get_knn()
         y_pred_knn = knn.predict(X_test)
         acc_knn = accuracy_score(y_test, y_pred_knn)
         print(f'KNN Accuracy: {acc_knn}')
 
-        plt.figure(figsize=(10, 5))
-        plt.bar(['Accuracy'], [acc_knn], color='green')
-        plt.title('KNN Performance')
-        plt.ylabel('Accuracy')
+        fig, ax = get_axes('knn')
+        ax.bar(['Accuracy'], [acc_knn], color='green')
+        ax.set_title('KNN Performance')
+        ax.set_ylabel('Accuracy')
+        fig.canvas.draw_idle()
         plt.show(block=False)  # Use block=False to prevent blocking the terminal
 
     def kmeans_clustering():
-        kmeans = KMeans(n_clusters=2)  # Assume 2 clusters for binary classification
-        kmeans.fit(X)
+        kmeans = get_kmeans()
         kmeans_labels = kmeans.labels_
         print(f'K-Means Clustering Labels: {np.unique(kmeans_labels)}')
 
-        plt.figure(figsize=(10, 5))
-        plt.hist(kmeans_labels, bins=2, color='orange', alpha=0.7)
-        plt.title('K-Means Clustering Distribution')
-        plt.xlabel('Clusters')
-        plt.ylabel('Count')
+        fig, ax = get_axes('kmeans')
+        ax.hist(kmeans_labels, bins=2, color='orange', alpha=0.7)
+        ax.set_title('K-Means Clustering Distribution')
+        ax.set_xlabel('Clusters')
+        ax.set_ylabel('Count')
+        fig.canvas.draw_idle()
         plt.show(block=False)  # Use block=False to prevent blocking the terminal
 
     def compare_all_algorithms():
-        linear_reg = LinearRegression()
-        linear_reg.fit(X_train, y_train)
-        y_pred_lin = linear_reg.predict(X_test)
+        linear_reg = get_linreg()
+        y_pred_lin = linear_reg.predict(X_test32)
         mse_lin = mean_squared_error(y_test, y_pred_lin)
 
-        knn = KNeighborsClassifier(n_neighbors=5)
-        knn.fit(X_train, y_train)
+        knn = get_knn()
         y_pred_knn = knn.predict(X_test)
         acc_knn = accuracy_score(y_test, y_pred_knn)
 
         # Plotting comparison
-        plt.figure(figsize=(10, 5))
-        plt.bar(['Linear Regression MSE', 'KNN Accuracy'], [mse_lin, acc_knn], color=['blue', 'green'])
-        plt.title('Algorithm Performance Comparison')
-        plt.ylabel('Performance Metric')
+        fig, ax = get_axes('compare')
+        ax.bar(['Linear Regression MSE', 'KNN Accuracy'], [mse_lin, acc_knn], color=['blue', 'green'])
+        ax.set_title('Algorithm Performance Comparison')
+        ax.set_ylabel('Performance Metric')
+        fig.canvas.draw_idle()
         plt.show(block=False)  # Use block=False to prevent blocking the terminal
 
     # Menu driven interface
@@ -141,6 +193,7 @@ try:
                 compare_all_algorithms()
             elif choice == '5':
                 print("Exiting...")
+                plt.close('all')
                 break
             else:
                 print("Invalid choice. Please select again.")
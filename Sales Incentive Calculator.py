@@ -1,16 +1,13 @@
 import streamlit as st
+import numpy as np
 import uuid
 
 st.set_page_config(page_title="💼 Sales Bonus System", layout="centered")
 st.title("🏆 Sales Incentive Calculator")
 
-# Internal bonus slabs (hidden from user)
-bonus_slabs = [
-    {"min": 0.0, "max": 5.0, "bonus": 0},
-    {"min": 5.0, "max": 10.0, "bonus": 10},
-    {"min": 10.0, "max": 15.0, "bonus": 12},
-    {"min": 15.0, "max": 999.0, "bonus": 15},
-]
+# Internal bonus slabs (hidden from user): slab i covers [edges[i], edges[i + 1])
+slab_edges = np.array([0.0, 5.0, 10.0, 15.0, 999.0])
+slab_bonuses = np.array([0, 10, 12, 15, 0])
 
 # Step 1: Ask name and ID
 st.header("👤 Salesperson Details")
@@ -40,12 +37,9 @@ if name and user_id:
             else:
                 sales_lakh = raw_sales
 
-            # Match against slab
-            matched_bonus = 0
-            for slab in bonus_slabs:
-                if slab["min"] <= sales_lakh < slab["max"]:
-                    matched_bonus = slab["bonus"]
-                    break
+            # Match against slab (negative sales fall outside every slab)
+            slab_index = np.searchsorted(slab_edges, sales_lakh, side="right") - 1
+            matched_bonus = int(slab_bonuses[slab_index]) if slab_index >= 0 else 0
 
             bonus_amount = (matched_bonus / 100) * sales_lakh * 100000
 
@@ -4,31 +4,85 @@ import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
 from sklearn.neighbors import KNeighborsClassifier
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import mean_squared_error, accuracy_score
 import matplotlib.pyplot as plt
 import os
 
+# Only the columns the models use are loaded; the numeric ones hold NaNs until the median fill
+USECOLS = ['price', 'bed', 'bath', 'acre_lot', 'house_size', 'status', 'city', 'state']
+DTYPES = {
+    'price': 'float32',
+    'bed': 'float32',
+    'bath': 'float32',
+    'acre_lot': 'float32',
+    'house_size': 'float32',
+    'status': 'category',
+    'city': 'category',
+    'state': 'category',
+}
+
 # Function to load data
 def load_data(file_path):
     try:
-        data = pd.read_csv(file_path)
+        data = pd.read_csv(file_path, usecols=USECOLS, dtype=DTYPES, engine='pyarrow')
         print("File loaded successfully.")
         return data
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' does not exist.")
         return None
 
+# Fitted models, each kept with the frame it was fitted on so repeated menu choices don't retrain.
+# Holding the frame itself (not its id) means a model is only reused for that same data
+_models = {}
+
+def get_linreg(X_train, y_train):
+    data, model = _models.get('linreg', (None, None))
+    if data is not X_train:
+        # Solve in float32: half the memory traffic of the float64 default
+        model = LinearRegression().fit(X_train.to_numpy(dtype=np.float32), y_train.to_numpy(dtype=np.float32))
+        _models['linreg'] = (X_train, model)
+    return model
+
+def get_knn(X_train, y_train):
+    data, model = _models.get('knn', (None, None))
+    if data is not X_train:
+        model = KNeighborsClassifier(n_neighbors=5, algorithm='kd_tree', n_jobs=-1).fit(X_train, y_train)
+        _models['knn'] = (X_train, model)
+    return model
+
+def get_kmeans(X):
+    data, model = _models.get('kmeans', (None, None))
+    if data is not X:
+        # Assume 2 clusters for binary classification; scale so no feature dominates the distances
+        model = MiniBatchKMeans(n_clusters=2, batch_size=4096, n_init=3, random_state=42)
+        model = model.fit(StandardScaler().fit_transform(X.to_numpy(dtype=np.float32)))
+        _models['kmeans'] = (X, model)
+    return model
+
+def get_model(name, X_train, y_train=None):
+    if name == 'Linear Regression':
+        return get_linreg(X_train, y_train)
+    if name == 'KNN':
+        return get_knn(X_train, y_train)
+    if name == 'K-Means Clustering':
+        return get_kmeans(X_train)
+    raise ValueError(f"Unknown algorithm: {name}")
+
+# Function to preview the first rows of the file without going through the full frame
+def preview(file_path, n):
+    return pd.read_csv(file_path, nrows=n)
+
 # Function to display data
-def display_data(data):
+def display_data(file_path):
     num_rows = int(input("How many rows of data do you wish to print? "))
-    print(data.head(num_rows))
+    print(preview(file_path, num_rows))
 
 # Function for Linear Regression
 def linear_regression(X_train, X_test, y_train, y_test):
-    model = LinearRegression()
-    model.fit(X_train, y_train)
-    predictions = model.predict(X_test)
+    model = get_model('Linear Regression', X_train, y_train)
+    predictions = model.predict(X_test.to_numpy(dtype=np.float32))
     mse = mean_squared_error(y_test, predictions)
     print(f"Linear Regression MSE: {mse}")
     
@@ -44,8 +98,7 @@ def linear_regression(X_train, X_test, y_train, y_test):
 
 # Function for K-Nearest Neighbors
 def knn(X_train, X_test, y_train, y_test):
-    model = KNeighborsClassifier(n_neighbors=5)
-    model.fit(X_train, y_train)
+    model = get_model('KNN', X_train, y_train)
     y_pred = model.predict(X_test)
     accuracy = accuracy_score(y_test, y_pred)
     print(f'KNN Accuracy: {accuracy}')
@@ -59,8 +112,7 @@ def knn(X_train, X_test, y_train, y_test):
 
 # Function for K-Means Clustering
 def kmeans_clustering(X):
-    model = KMeans(n_clusters=2)  # Assume 2 clusters for binary classification
-    model.fit(X)
+    model = get_model('K-Means Clustering', X)
     labels = model.labels_
     print(f'K-Means Clustering Labels: {np.unique(labels)}')
 
@@ -78,16 +130,14 @@ def compare_two_algorithms(X_train, X_test, y_train, y_test, algo1, algo2):
 
     # Compare Linear Regression
     if algo1 == 'Linear Regression':
-        model1 = LinearRegression()
-        model1.fit(X_train, y_train)
-        predictions1 = model1.predict(X_test)
+        model1 = get_model('Linear Regression', X_train, y_train)
+        predictions1 = model1.predict(X_test.to_numpy(dtype=np.float32))
         mse1 = mean_squared_error(y_test, predictions1)
         results['Linear Regression'] = mse1
         print(f"Linear Regression MSE: {mse1}")
 
     elif algo1 == 'KNN':
-        model1 = KNeighborsClassifier(n_neighbors=5)
-        model1.fit(X_train, y_train)
+        model1 = get_model('KNN', X_train, y_train)
         predictions1 = model1.predict(X_test)
         accuracy1 = accuracy_score(y_test, predictions1)
         results['KNN'] = accuracy1
@@ -95,16 +145,14 @@ def compare_two_algorithms(X_train, X_test, y_train, y_test, algo1, algo2):
 
     # Compare K-Means Clustering
     if algo2 == 'Linear Regression':
-        model2 = LinearRegression()
-        model2.fit(X_train, y_train)
-        predictions2 = model2.predict(X_test)
+        model2 = get_model('Linear Regression', X_train, y_train)
+        predictions2 = model2.predict(X_test.to_numpy(dtype=np.float32))
         mse2 = mean_squared_error(y_test, predictions2)
         results['Linear Regression'] = mse2
         print(f"Linear Regression MSE: {mse2}")
 
     elif algo2 == 'KNN':
-        model2 = KNeighborsClassifier(n_neighbors=5)
-        model2.fit(X_train, y_train)
+        model2 = get_model('KNN', X_train, y_train)
         predictions2 = model2.predict(X_test)
         accuracy2 = accuracy_score(y_test, predictions2)
         results['KNN'] = accuracy2
@@ -122,20 +170,17 @@ def compare_all_algorithms(X_train, X_test, y_train, y_test):
     results = {}
 
     # Linear Regression
-    model = LinearRegression()
-    model.fit(X_train, y_train)
-    y_pred = model.predict(X_test)
+    model = get_model('Linear Regression', X_train, y_train)
+    y_pred = model.predict(X_test.to_numpy(dtype=np.float32))
     results['Linear Regression'] = mean_squared_error(y_test, y_pred)
 
     # K-Nearest Neighbors
-    knn_model = KNeighborsClassifier(n_neighbors=5)
-    knn_model.fit(X_train, y_train)
+    knn_model = get_model('KNN', X_train, y_train)
     knn_pred = knn_model.predict(X_test)
     results['KNN'] = accuracy_score(y_test, knn_pred)
 
     # K-Means Clustering (for comparison, using the same X)
-    kmeans_model = KMeans(n_clusters=2)
-    kmeans_model.fit(X_train)  # Using training data for clustering
+    kmeans_model = get_model('K-Means Clustering', X_train)  # Using training data for clustering
     kmeans_labels = kmeans_model.labels_
     results['K-Means Clustering'] = 'Labels generated, check console'
 
@@ -169,12 +214,12 @@ def menu():
         return
 
     # Handle missing data
-    numeric_cols = data.select_dtypes(include=[np.number]).columns
-    data[numeric_cols] = data[numeric_cols].fillna(data[numeric_cols].median())
+    data.fillna(data.median(numeric_only=True), inplace=True)
     
     # Encode categorical data (status, city, state) using Label Encoding
-    for column in ['status', 'city', 'state']:
-        data[column] = data[column].astype('category').cat.codes
+    # The columns are parsed as categoricals, so the codes already exist: no factorize/sort pass needed
+    for column in ('status', 'city', 'state'):
+        data[column] = data[column].cat.codes
 
     # Feature selection (selecting only the relevant columns)
     X = data[['price', 'bed', 'bath', 'acre_lot', 'house_size']]  # Select numeric features
@@ -193,7 +238,7 @@ def menu():
         choice = input("Enter your choice: ")
 
         if choice == '1':
-            display_data(data)
+            display_data(file_path)
         elif choice == '2':
             print("Choose an algorithm:")
             print("1. Linear Regression")
@@ -1,15 +1,29 @@
 import tensorflow as tf
-from tensorflow.keras.preprocessing.image import ImageDataGenerator
+from tensorflow.keras import mixed_precision
 from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Conv2D, MaxPooling2D, Flatten, Dense, Dropout
+from tensorflow.keras.layers import Conv2D, MaxPooling2D, Flatten, Dense, Dropout, Activation, Rescaling, RandomFlip, RandomZoom
 from keras.datasets import cifar10
 
+# Compute in float16 with float32 weights; Keras applies loss scaling automatically
+mixed_precision.set_global_policy('mixed_float16')
+
+AUTOTUNE = tf.data.AUTOTUNE
+
 # Data preprocessing
-train_datagen = ImageDataGenerator(rescale=1./255, shear_range=0.2, zoom_range=0.2, horizontal_flip=True)
-test_datagen = ImageDataGenerator(rescale=1./255)
+# Decoded images are cached in memory after the first epoch and augmented in parallel outside the training step
+rescale = Rescaling(1./255)
+augment = Sequential([rescale, RandomFlip('horizontal'), RandomZoom(0.2)])
+
+training_set = tf.keras.utils.image_dataset_from_directory('dataset/training_set', image_size=(64, 64), batch_size=32, label_mode='binary')
+test_set = tf.keras.utils.image_dataset_from_directory('dataset/test_set', image_size=(64, 64), batch_size=32, label_mode='binary')
 
-training_set = train_datagen.flow_from_directory('dataset/training_set', target_size=(64, 64), batch_size=32, class_mode='binary')
-test_set = test_datagen.flow_from_directory('dataset/test_set', target_size=(64, 64), batch_size=32, class_mode='binary')
+training_set = (training_set.cache()
+                .shuffle(2048)
+                .map(lambda x, y: (augment(x, training=True), y), num_parallel_calls=AUTOTUNE)
+                .prefetch(AUTOTUNE))
+test_set = (test_set.map(lambda x, y: (rescale(x), y), num_parallel_calls=AUTOTUNE)
+            .cache()
+            .prefetch(AUTOTUNE))
 
 # Building the CNN
 model = Sequential()
@@ -32,13 +46,14 @@ model.add(Flatten())
 # Full connection
 model.add(Dense(units=128, activation='relu'))
 model.add(Dropout(0.5))
-model.add(Dense(units=1, activation='sigmoid'))
+model.add(Dense(units=1))
+model.add(Activation('sigmoid', dtype='float32'))  # Keep the output in float32 for numerical stability
 
 # Compiling the CNN
 model.compile(optimizer='adam', loss='binary_crossentropy', metrics=['accuracy'])
 
 # Training the CNN on the Training set and evaluating it on the Test set
-model.fit(training_set, steps_per_epoch=8000//32, epochs=25, validation_data=test_set, validation_steps=2000//32)
+model.fit(training_set, epochs=25, validation_data=test_set)
 
 # Save the model
 model.save('cat_dog_cnn_model.h5')
\ No newline at end of file
@@ -4,6 +4,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import tensorflow as tf
 from tensorflow import keras
+from tensorflow.keras import mixed_precision
+
+# Compute in float16 with float32 weights; Keras applies loss scaling automatically
+mixed_precision.set_global_policy('mixed_float16')
 
 # Load the MNIST dataset
 (X_train, y_train), (X_test, y_test) = keras.datasets.mnist.load_data()
@@ -18,14 +22,15 @@ plt.title(f"Label: {y_train[0]}")
 plt.axis('off')
 plt.show()
 
-# Flatten the images
-X_train_flattened = X_train.reshape(len(X_train), 28*28)
-X_test_flattened = X_test.reshape(len(X_test), 28*28)
+# Flatten the images and scale them to [0, 1] as float32 once, rather than casting uint8 every batch
+X_train_flattened = X_train.reshape(-1, 28*28).astype(np.float32) * (1.0 / 255.0)
+X_test_flattened = X_test.reshape(-1, 28*28).astype(np.float32) * (1.0 / 255.0)
 
 # Very simple neural network with no hidden layers.
 # Sequential creates the neural network.
 model = keras.Sequential([
-    keras.layers.Dense(10, input_shape=(784,), activation='softmax')
+    keras.layers.Dense(10, input_shape=(784,)),
+    keras.layers.Activation('softmax', dtype='float32')  # Keep the output in float32 for numerical stability
 ])
 
 model.compile(optimizer='adam',
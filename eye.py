@@ -1,54 +1,73 @@
 import time
 import sys
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from numba import njit
 
+# Pass --fast to time NumPy's C mergesort instead of the pure-Python merge_sort
+FAST_MODE = '--fast' in sys.argv[1:]
+
+DATASET_TYPES = {
+    '1': ['small_random', 'small_sorted', 'small_reverse_sorted', 'small_duplicates', 'small_partial_sorted'],
+    '2': ['medium_random', 'medium_sorted', 'medium_reverse_sorted', 'medium_duplicates', 'medium_partial_sorted'],
+    '3': ['large_random', 'large_sorted', 'large_reverse_sorted', 'large_duplicates', 'large_partial_sorted'],
+}
+
+@njit(cache=True)
 def bubble_sort(arr):
-    n = len(arr)
+    n = arr.shape[0]
     for i in range(n):
         for j in range(0, n - i - 1):
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
 
-def merge_sort(arr):
-    if len(arr) > 1:
-        mid = len(arr) // 2
-        left_half = arr[:mid]
-        right_half = arr[mid:]
-
-        merge_sort(left_half)
-        merge_sort(right_half)
-
-        i = j = k = 0
-        while i < len(left_half) and j < len(right_half):
-            if left_half[i] < right_half[j]:
-                arr[k] = left_half[i]
-                i += 1
-            else:
-                arr[k] = right_half[j]
-                j += 1
-            k += 1
-
-        while i < len(left_half):
-            arr[k] = left_half[i]
-            i += 1
-            k += 1
+# Compile once up front so the first timed run doesn't include JIT time
+bubble_sort(np.array([1, 0], dtype=np.int64))
 
-        while j < len(right_half):
-            arr[k] = right_half[j]
+def merge(src, dst, lo, mid, hi):
+    i, j = lo, mid
+    for k in range(lo, hi):
+        if j >= hi or (i < mid and src[i] <= src[j]):
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
             j += 1
-            k += 1
+
+def merge_sort(arr):
+    # Bottom-up merges that ping-pong between arr and one scratch buffer, no per-level slices
+    n = len(arr)
+    src, dst = arr, [0] * n
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            merge(src, dst, lo, min(lo + width, n), min(lo + 2 * width, n))
+        src, dst = dst, src
+        width *= 2
+    if src is not arr:
+        arr[:] = src
+
+def merge_sort_np(arr):
+    arr.sort(kind='mergesort')
+
+def merge_sort_input(data):
+    if FAST_MODE:
+        return merge_sort_np, data.copy()
+    return merge_sort, data.tolist()
 
 def measure_performance(sort_function, arr):
     start_time = time.perf_counter()
     sort_function(arr)
     end_time = time.perf_counter()
     elapsed_time = end_time - start_time
-    return elapsed_time, sys.getsizeof(arr)
+    # Element storage of the sorted data, the same measure whether it is a list or an array
+    space = np.asarray(arr).nbytes
+    return elapsed_time, space
 
 def run_sorting_analysis(dataset_types):
     for dataset_type in dataset_types:
-        data = df[dataset_type].dropna().astype(int).tolist()
+        data = prepared[dataset_type]
         print(f"\nDataset Type: {dataset_type}")
         print("Original Data:", data[:10], "...")
 
@@ -57,24 +76,23 @@ def run_sorting_analysis(dataset_types):
         print("Bubble Sort Sorted Data:", bubble_sorted[:10], "...")
         print(f"Bubble Sort Time: {bubble_time:.5f} sec, Space: {bubble_space} bytes")
 
-        merge_sorted = data.copy()
-        merge_time, merge_space = measure_performance(merge_sort, merge_sorted)
+        merge_function, merge_sorted = merge_sort_input(data)
+        merge_time, merge_space = measure_performance(merge_function, merge_sorted)
         print("Merge Sort Sorted Data:", merge_sorted[:10], "...")
         print(f"Merge Sort Time: {merge_time:.5f} sec, Space: {merge_space} bytes")
 
 def plot_comparison_chart(dataset_types):
-    sizes = [len(df[dataset_type].dropna()) for dataset_type in dataset_types]
+    sizes = [len(prepared[dataset_type]) for dataset_type in dataset_types]
     bubble_times = []
     merge_times = []
 
     for dataset_type in dataset_types:
-        data = df[dataset_type].dropna().astype(int).tolist()
-        bubble_sorted = data.copy()
+        bubble_sorted = prepared[dataset_type].copy()
         bubble_time, _ = measure_performance(bubble_sort, bubble_sorted)
         bubble_times.append(bubble_time)
 
-        merge_sorted = data.copy()
-        merge_time, _ = measure_performance(merge_sort, merge_sorted)
+        merge_function, merge_sorted = merge_sort_input(prepared[dataset_type])
+        merge_time, _ = measure_performance(merge_function, merge_sorted)
         merge_times.append(merge_time)
 
     plt.plot(sizes, bubble_times, label='Bubble Sort', marker='o')
@@ -87,18 +105,20 @@ def plot_comparison_chart(dataset_types):
     plt.show()
 
 if __name__ == "__main__":
-    df = pd.read_csv('shree.csv')
+    needed = [column for columns in DATASET_TYPES.values() for column in columns]
+    df = pd.read_csv('shree.csv', usecols=needed, engine='pyarrow')
+    # Convert every column once; each sort run works on its own copy
+    prepared = {
+        column: df[column].dropna().to_numpy(np.int64)
+        for column in needed
+    }
     
     while True:
         print("\n1. Small Data\n2. Medium Data\n3. Large Data\n4. Exit")
         choice = input("Select dataset size: ")
 
-        if choice == '1':
-            dataset_types = ['small_random', 'small_sorted', 'small_reverse_sorted', 'small_duplicates', 'small_partial_sorted']
-        elif choice == '2':
-            dataset_types = ['medium_random', 'medium_sorted', 'medium_reverse_sorted', 'medium_duplicates', 'medium_partial_sorted']
-        elif choice == '3':
-            dataset_types = ['large_random', 'large_sorted', 'large_reverse_sorted', 'large_duplicates', 'large_partial_sorted']
+        if choice in DATASET_TYPES:
+            dataset_types = DATASET_TYPES[choice]
         elif choice == '4':
             break
         else:
@@ -1,7 +1,27 @@
 from pynput import keyboard
-from datetime import datetime
+import atexit
+import threading
+import time
 
 LOG_FILE = "key_log.txt"
+FLUSH_INTERVAL = 2.0  # seconds between flushes of buffered log lines
+
+# Keep one buffered handle open instead of reopening the file on every key
+log_file = open(LOG_FILE, "a", buffering=8192)
+atexit.register(log_file.close)
+
+flush_timer = None
+
+def flush_log():
+    global flush_timer
+    try:
+        log_file.flush()
+    except ValueError:
+        # The file was closed at exit while this flush was pending
+        return
+    flush_timer = threading.Timer(FLUSH_INTERVAL, flush_log)
+    flush_timer.daemon = True
+    flush_timer.start()
 
 def on_press(key):
     try:
@@ -9,13 +29,12 @@ def on_press(key):
     except AttributeError:
         key_data = str(key)  # For special keys
 
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
     log_entry = f"[{timestamp}] Key Pressed: {key_data}"
 
     print(log_entry)
-    # Save to file
-    with open(LOG_FILE, "a") as f:
-        f.write(log_entry + "\n")
+    # Save to file (flushed by flush_log)
+    log_file.write(log_entry + "\n")
 
 def on_release(key):
     # Press ESC to stop the logger
@@ -25,6 +44,11 @@ def on_release(key):
 
 print("🎮 Game Key Tracker Started (press ESC to stop)")
 print("-----------------------------------------------")
+flush_log()
 
 with keyboard.Listener(on_press=on_press, on_release=on_release) as listener:
     listener.join()
+
+# Stop the periodic flush before the final one so it can't run against a closed file
+flush_timer.cancel()
+log_file.flush()
@@ -37,8 +37,8 @@ def display_data(data):
 
 # Preprocess the data (handle missing values and label encoding)
 def preprocess_data(data):
-    numeric_cols = data.select_dtypes(include=[np.number]).columns
-    data[numeric_cols] = data[numeric_cols].fillna(data[numeric_cols].median())
+    # One median pass over the numeric columns, filled in place
+    data.fillna(data.median(numeric_only=True), inplace=True)
     
     # Drop 'prev_sold_date' if present
     if 'prev_sold_date' in data.columns:
@@ -51,6 +51,16 @@ def preprocess_data(data):
     
     return data
 
+# One figure per plot, cleared and redrawn instead of allocating a new figure on every call
+_figures = {}
+
+def get_axes(name):
+    fig = _figures.get(name)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = _figures[name] = plt.figure()
+    fig.clf()
+    return fig, fig.add_subplot(111)
+
 # Function for Linear Regression
 def linear_regression(X_train, X_test, y_train, y_test):
     model = LinearRegression()
@@ -59,16 +69,18 @@ def linear_regression(X_train, X_test, y_train, y_test):
     mse = mean_squared_error(y_test, predictions)
     print(f"Linear Regression MSE: {mse}")
     
-    # Plotting Actual vs Predicted Values
-    plt.scatter(X_test['price'], y_test, color='blue', label="Actual")
-    plt.scatter(X_test['price'], predictions, color='red', label="Predicted")
+    # Plotting Actual vs Predicted Values; marker-only lines skip scatter's per-point size/colour handling
+    fig, ax = get_axes('linreg')
+    price = X_test['price'].to_numpy()
+    ax.plot(price, y_test.to_numpy(), linestyle='', marker='o', color='blue', label="Actual")
+    ax.plot(price, predictions, linestyle='', marker='o', color='red', label="Predicted")
     
     # Plotting the Regression Line
-    plt.plot(X_test['price'], predictions, color='red', label="Regression Line")
-    plt.title('Linear Regression: Actual vs Predicted')
-    plt.xlabel('Price')
-    plt.ylabel('Target')
-    plt.legend()
+    ax.plot(price, predictions, color='red', label="Regression Line")
+    ax.set_title('Linear Regression: Actual vs Predicted')
+    ax.set_xlabel('Price')
+    ax.set_ylabel('Target')
+    ax.legend()
     plt.show()
 
     return mse
@@ -82,10 +94,12 @@ def knn(X_train, X_test, y_train, y_test):
     print(f"KNN Accuracy: {accuracy}")
     
     # Plot for KNN
-    plt.scatter(X_test['price'], y_test, color='blue', label='Actual')
-    plt.scatter(X_test['price'], predictions, color='red', label='Predicted')
-    plt.title('KNN: Actual vs Predicted')
-    plt.legend(loc='upper left')
+    fig, ax = get_axes('knn')
+    price = X_test['price'].to_numpy()
+    ax.plot(price, y_test.to_numpy(), linestyle='', marker='o', color='blue', label='Actual')
+    ax.plot(price, predictions, linestyle='', marker='o', color='red', label='Predicted')
+    ax.set_title('KNN: Actual vs Predicted')
+    ax.legend(loc='upper left')
     plt.show()
 
 # Function for K-Means Regression
@@ -99,16 +113,17 @@ def kmeans_regression(X, y, n_clusters=2):
     print(f'K-Means Clustering Labels: {np.unique(labels)}')
     
     # Plotting K-Means Clustering output
+    fig, ax = get_axes('kmeans')
     for cluster in np.unique(labels):
         # Get indices of the samples belonging to this cluster
         cluster_indices = np.where(labels == cluster)[0]
         X_cluster = X.iloc[cluster_indices]  # Use .iloc to get the rows
-        plt.scatter(X_cluster['price'], X_cluster['house_size'], label=f'Cluster {cluster}')
+        ax.scatter(X_cluster['price'], X_cluster['house_size'], label=f'Cluster {cluster}')
 
-    plt.title('K-Means Clustering')
-    plt.xlabel('Price')
-    plt.ylabel('House Size')
-    plt.legend(loc='upper left')  # Specifying legend location
+    ax.set_title('K-Means Clustering')
+    ax.set_xlabel('Price')
+    ax.set_ylabel('House Size')
+    ax.legend(loc='upper left')  # Specifying legend location
     plt.show()
 
 # Function to compare two algorithms
@@ -1,52 +1,120 @@
 import time
 import sys
-import random
+import timeit
+import numpy as np
+from numba import njit
 import tkinter as tk
 from tkinter import messagebox, ttk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+# Seeded so every run benchmarks the same inputs
+RNG = np.random.default_rng(42)
+
 # Sorting Algorithms
+@njit(cache=True, boundscheck=False)
 def bubble_sort(arr):
-    n = len(arr)
+    n = arr.shape[0]
     for i in range(n):
         for j in range(0, n - i - 1):
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
 
-def merge_sort(arr):
-    if len(arr) > 1:
-        mid = len(arr) // 2
-        left_half = arr[:mid]
-        right_half = arr[mid:]
-        merge_sort(left_half)
-        merge_sort(right_half)
-        i = j = k = 0
-        while i < len(left_half) and j < len(right_half):
-            if left_half[i] < right_half[j]:
-                arr[k] = left_half[i]
-                i += 1
-            else:
-                arr[k] = right_half[j]
-                j += 1
-            k += 1
-        while i < len(left_half):
-            arr[k] = left_half[i]
+@njit(cache=True, boundscheck=False)
+def merge(src, dst, lo, mid, hi):
+    i, j = lo, mid
+    for k in range(lo, hi):
+        if j >= hi or (i < mid and src[i] <= src[j]):
+            dst[k] = src[i]
             i += 1
-            k += 1
-        while j < len(right_half):
-            arr[k] = right_half[j]
+        else:
+            dst[k] = src[j]
             j += 1
-            k += 1
 
+@njit(cache=True, boundscheck=False)
+def merge_sort(arr):
+    # Bottom-up merges that ping-pong between arr and one scratch buffer
+    n = arr.shape[0]
+    src, dst = arr, np.empty_like(arr)
+    swapped = False
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            merge(src, dst, lo, min(lo + width, n), min(lo + 2 * width, n))
+        src, dst = dst, src
+        swapped = not swapped
+        width *= 2
+    if swapped:
+        arr[:] = src
+
+@njit(cache=True, boundscheck=False)
+def insertion_sort(arr, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+@njit(cache=True, boundscheck=False)
+def partition(arr, lo, hi):
+    # Hoare partition around the middle element: arr[lo..p] <= pivot <= arr[p+1..hi]
+    pivot = arr[(lo + hi) // 2]
+    i, j = lo - 1, hi + 1
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while arr[j] > pivot:
+            j -= 1
+        if i >= j:
+            return j
+        arr[i], arr[j] = arr[j], arr[i]
+
+@njit(cache=True, boundscheck=False)
 def quick_sort(arr):
-    if len(arr) <= 1:
-        return arr
-    pivot = arr[len(arr) // 2]
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
-    return quick_sort(left) + middle + quick_sort(right)
+    # In-place quicksort; small ranges finish with insertion sort. The larger half of each
+    # split is pushed on an explicit stack and the smaller one handled next, so depth stays O(log n)
+    stack = np.empty(128, dtype=np.int64)
+    top = 0
+    lo, hi = 0, arr.shape[0] - 1
+    while True:
+        while hi - lo >= 16:
+            p = partition(arr, lo, hi)
+            if p - lo < hi - p:
+                stack[top], stack[top + 1] = p + 1, hi
+                hi = p
+            else:
+                stack[top], stack[top + 1] = lo, p
+                lo = p + 1
+            top += 2
+        insertion_sort(arr, lo, hi)
+        if top == 0:
+            break
+        top -= 2
+        lo, hi = stack[top], stack[top + 1]
+
+# Compile once up front so the first timed run doesn't include JIT time
+bubble_sort(np.array([1, 0], dtype=np.int64))
+merge_sort(np.array([1, 0], dtype=np.int64))
+quick_sort(np.array([1, 0], dtype=np.int64))
+
+def numpy_sort(arr):
+    arr.sort()
+
+# Real timing of a sort for a given size (best of 3 runs, each on a fresh copy of the input)
+def time_sort(sort_function, size):
+    arr = RNG.integers(0, size + 1, size=size, dtype=np.int64)
+    return min(timeit.repeat(lambda: sort_function(arr.copy()), number=1, repeat=3))
+
+# Bubble sort is O(n^2), so chart sizes above this are left as gaps instead of timed
+BUBBLE_MAX_SIZE = 10000
+
+def chart_times(sort_function, input_sizes):
+    return [np.nan if sort_function is bubble_sort and size > BUBBLE_MAX_SIZE else time_sort(sort_function, size)
+            for size in input_sizes]
 
 # Performance Measurement
 def measure_performance(sort_function, arr):
@@ -59,7 +127,7 @@ def measure_performance(sort_function, arr):
 # Function to start analysis
 def run_analysis():
     size = int(size_var.get())
-    arr = [random.randint(0, size) for _ in range(size)]
+    arr = RNG.integers(0, size + 1, size=size, dtype=np.int64)
     result_output = ""
     if algorithm_var.get() == "Bubble Sort":
         bubble_time, bubble_space = measure_performance(bubble_sort, arr.copy())
@@ -70,31 +138,45 @@ def run_analysis():
     if algorithm_var.get() == "Quick Sort":
         quick_time, quick_space = measure_performance(quick_sort, arr.copy())
         result_output += f"Quick Sort: {quick_time:.5f}s, {quick_space / 1024:.2f} KB"
+    if algorithm_var.get() == "NumPy Sort":
+        numpy_time, numpy_space = measure_performance(numpy_sort, arr.copy())
+        result_output += f"NumPy Sort: {numpy_time:.5f}s, {numpy_space / 1024:.2f} KB"
     result_text.set(result_output)
     messagebox.showinfo("Analysis Complete", "Sorting analysis has been completed!")
     show_chart()
 
 # Function to show charts
+# The figure, its lines and the Tk canvas are built on the first call and updated in place afterwards
+_chart = {}
+
 def show_chart():
     input_sizes = [10, 100, 1000, 10000, 100000, 1000000]
-    bubble_times = [random.uniform(0.01, 1.5) for _ in input_sizes]
-    merge_times = [random.uniform(0.001, 0.5) for _ in input_sizes]
-    quick_times = [random.uniform(0.001, 0.3) for _ in input_sizes]
-    plt.style.use('dark_background')
-    fig, ax = plt.subplots(figsize=(6, 4), facecolor='#000033')
-    ax.plot(input_sizes, bubble_times, label='Bubble Sort', marker='o', color='cyan', linewidth=3)
-    ax.plot(input_sizes, merge_times, label='Merge Sort', marker='x', color='magenta', linewidth=3)
-    ax.plot(input_sizes, quick_times, label='Quick Sort', marker='s', color='yellow', linewidth=3)
-    ax.set_xlabel('Input Size', color='white', fontsize=14, fontweight='bold')
-    ax.set_ylabel('Time (seconds)', color='white', fontsize=14, fontweight='bold')
-    ax.set_title('Sorting Algorithm Comparison', color='white', fontsize=16, fontweight='bold')
-    ax.legend()
-    ax.grid(True, color='gray', linestyle='--')
-    for widget in graph_frame.winfo_children():
-        widget.destroy()
-    canvas = FigureCanvasTkAgg(fig, master=graph_frame)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    series = {
+        'Bubble Sort': chart_times(bubble_sort, input_sizes),
+        'Merge Sort': chart_times(merge_sort, input_sizes),
+        'Quick Sort': chart_times(quick_sort, input_sizes),
+        'NumPy Sort': chart_times(numpy_sort, input_sizes),
+    }
+    if not _chart:
+        plt.style.use('dark_background')
+        fig, ax = plt.subplots(figsize=(6, 4), facecolor='#000033')
+        lines = {}
+        for label, marker, color in [('Bubble Sort', 'o', 'cyan'), ('Merge Sort', 'x', 'magenta'),
+                                     ('Quick Sort', 's', 'yellow'), ('NumPy Sort', '^', 'lime')]:
+            lines[label], = ax.plot([], [], label=label, marker=marker, color=color, linewidth=3)
+        ax.set_xlabel('Input Size', color='white', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Time (seconds)', color='white', fontsize=14, fontweight='bold')
+        ax.set_title('Sorting Algorithm Comparison', color='white', fontsize=16, fontweight='bold')
+        ax.legend()
+        ax.grid(True, color='gray', linestyle='--')
+        canvas = FigureCanvasTkAgg(fig, master=graph_frame)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        _chart.update(ax=ax, lines=lines, canvas=canvas)
+    for label, times in series.items():
+        _chart['lines'][label].set_data(input_sizes, times)
+    _chart['ax'].relim()
+    _chart['ax'].autoscale_view()
+    _chart['canvas'].draw_idle()
 
 # GUI Application
 root = tk.Tk()
@@ -110,7 +192,7 @@ input_frame.pack(side=tk.LEFT, padx=20, pady=20)
 
 algorithm_var = tk.StringVar(value="Bubble Sort")
 tk.Label(input_frame, text="Select Sorting Algorithm:", bg='#000033', fg='white', font=("Arial", 14, 'bold')).grid(row=0, column=0, pady=5)
-algorithm_options = ["Bubble Sort", "Merge Sort", "Quick Sort"]
+algorithm_options = ["Bubble Sort", "Merge Sort", "Quick Sort", "NumPy Sort"]
 algorithm_dropdown = ttk.Combobox(input_frame, textvariable=algorithm_var, values=algorithm_options)
 algorithm_dropdown.grid(row=0, column=1, padx=10)
 
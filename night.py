@@ -1,43 +1,70 @@
 import time
 import sys
-import random
+import timeit
+import numpy as np
+from numba import njit
 import tkinter as tk
 from tkinter import ttk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+# Seeded so every run benchmarks the same inputs
+RNG = np.random.default_rng(42)
+
 # Sorting Algorithms
+@njit(cache=True, boundscheck=False)
 def bubble_sort(arr):
-    n = len(arr)
+    n = arr.shape[0]
     for i in range(n):
         for j in range(0, n - i - 1):
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
 
-def merge_sort(arr):
-    if len(arr) > 1:
-        mid = len(arr) // 2
-        left_half = arr[:mid]
-        right_half = arr[mid:]
-        merge_sort(left_half)
-        merge_sort(right_half)
-        i = j = k = 0
-        while i < len(left_half) and j < len(right_half):
-            if left_half[i] < right_half[j]:
-                arr[k] = left_half[i]
-                i += 1
-            else:
-                arr[k] = right_half[j]
-                j += 1
-            k += 1
-        while i < len(left_half):
-            arr[k] = left_half[i]
+@njit(cache=True, boundscheck=False)
+def merge(src, dst, lo, mid, hi):
+    i, j = lo, mid
+    for k in range(lo, hi):
+        if j >= hi or (i < mid and src[i] <= src[j]):
+            dst[k] = src[i]
             i += 1
-            k += 1
-        while j < len(right_half):
-            arr[k] = right_half[j]
+        else:
+            dst[k] = src[j]
             j += 1
-            k += 1
+
+@njit(cache=True, boundscheck=False)
+def merge_sort(arr):
+    # Bottom-up merges that ping-pong between arr and one scratch buffer
+    n = arr.shape[0]
+    src, dst = arr, np.empty_like(arr)
+    swapped = False
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            merge(src, dst, lo, min(lo + width, n), min(lo + 2 * width, n))
+        src, dst = dst, src
+        swapped = not swapped
+        width *= 2
+    if swapped:
+        arr[:] = src
+
+# Compile once up front so the first timed run doesn't include JIT time
+bubble_sort(np.array([1, 0], dtype=np.int64))
+merge_sort(np.array([1, 0], dtype=np.int64))
+
+def numpy_sort(arr):
+    arr.sort()
+
+# Real timing of a sort for a given size (best of 3 runs, each on a fresh copy of the input)
+def time_sort(sort_function, size):
+    arr = RNG.integers(0, size + 1, size=size, dtype=np.int64)
+    return min(timeit.repeat(lambda: sort_function(arr.copy()), number=1, repeat=3))
+
+# Bubble sort is O(n^2), so chart sizes above this are left as gaps instead of timed
+BUBBLE_MAX_SIZE = 10000
+
+def chart_times(sort_function, input_sizes):
+    return [np.nan if sort_function is bubble_sort and size > BUBBLE_MAX_SIZE else time_sort(sort_function, size)
+            for size in input_sizes]
 
 # Performance Measurement
 def measure_performance(sort_function, arr):
@@ -49,44 +76,62 @@ def measure_performance(sort_function, arr):
 
 def run_analysis():
     size = int(size_var.get())
-    arr = [random.randint(0, size) for _ in range(size)]
+    arr = RNG.integers(0, size + 1, size=size, dtype=np.int64)
     if algorithm_var.get() == "Bubble Sort":
         time_taken, _ = measure_performance(bubble_sort, arr.copy())
         result_text.set(f"Bubble Sort: {time_taken:.5f} seconds")
     elif algorithm_var.get() == "Merge Sort":
         time_taken, _ = measure_performance(merge_sort, arr.copy())
         result_text.set(f"Merge Sort: {time_taken:.5f} seconds")
+    elif algorithm_var.get() == "NumPy Sort":
+        time_taken, _ = measure_performance(numpy_sort, arr.copy())
+        result_text.set(f"NumPy Sort: {time_taken:.5f} seconds")
     elif algorithm_var.get() == "Bubble vs Merge":
         bubble_time, _ = measure_performance(bubble_sort, arr.copy())
         merge_time, _ = measure_performance(merge_sort, arr.copy())
         result_text.set(f"Bubble Sort: {bubble_time:.5f}s\nMerge Sort: {merge_time:.5f}s")
     show_chart()
 
+# The figure, its lines and the Tk canvas are built on the first call and updated in place afterwards
+_chart = {}
+
 def show_chart():
     input_sizes = [10, 100, 1000, 10000, 100000, 1000000]
-    plt.style.use('dark_background')
-
-    fig, ax = plt.subplots(figsize=(6, 4))
-    bubble_times = [random.uniform(0.01, 1.5) for _ in input_sizes]
-    merge_times = [random.uniform(0.001, 0.5) for _ in input_sizes]
+    if not _chart:
+        plt.style.use('dark_background')
+        fig, ax = plt.subplots(figsize=(6, 4))
+        lines = {}
+        for label, marker, color in [('Bubble Sort', 'o', 'cyan'), ('Merge Sort', 'x', 'magenta'),
+                                     ('NumPy Sort', '^', 'lime')]:
+            lines[label], = ax.plot([], [], label=label, marker=marker, color=color, linewidth=3)
+        ax.set_xlabel('Input Size')
+        ax.set_ylabel('Time (seconds)')
+        ax.set_title('Sorting Performance')
+        ax.grid(True, color='gray', linestyle='--')
+        canvas = FigureCanvasTkAgg(fig, master=graph_frame)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        _chart.update(ax=ax, lines=lines, canvas=canvas)
 
     if algorithm_var.get() == "Bubble Sort":
-        ax.plot(input_sizes, bubble_times, label='Bubble Sort', marker='o', color='cyan', linewidth=3)
+        sorts = {'Bubble Sort': bubble_sort}
     elif algorithm_var.get() == "Merge Sort":
-        ax.plot(input_sizes, merge_times, label='Merge Sort', marker='x', color='magenta', linewidth=3)
+        sorts = {'Merge Sort': merge_sort}
+    elif algorithm_var.get() == "NumPy Sort":
+        sorts = {'NumPy Sort': numpy_sort}
     else:
-        ax.plot(input_sizes, bubble_times, label='Bubble Sort', marker='o', color='cyan', linewidth=3)
-        ax.plot(input_sizes, merge_times, label='Merge Sort', marker='x', color='magenta', linewidth=3)
-    ax.set_xlabel('Input Size')
-    ax.set_ylabel('Time (seconds)')
-    ax.set_title('Sorting Performance')
-    ax.legend()
-    ax.grid(True, color='gray', linestyle='--')
-    for widget in graph_frame.winfo_children():
-        widget.destroy()
-    canvas = FigureCanvasTkAgg(fig, master=graph_frame)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        sorts = {'Bubble Sort': bubble_sort, 'Merge Sort': merge_sort}
+    series = {label: chart_times(sort_function, input_sizes) for label, sort_function in sorts.items()}
+
+    # Only the selected algorithms' lines are shown and listed in the legend
+    ax, lines = _chart['ax'], _chart['lines']
+    for label, line in lines.items():
+        line.set_visible(label in series)
+        if label in series:
+            line.set_data(input_sizes, series[label])
+    ax.legend(handles=[lines[label] for label in series])
+    ax.relim(visible_only=True)
+    ax.autoscale_view()
+    _chart['canvas'].draw_idle()
 
 # GUI Application
 root = tk.Tk()
@@ -107,7 +152,7 @@ input_frame.pack(side=tk.LEFT, padx=20)
 
 tk.Label(input_frame, text="Select Sorting Algorithm:").grid(row=0, column=0, pady=10)
 algorithm_var = tk.StringVar(value="Bubble Sort")
-algorithm_dropdown = ttk.Combobox(input_frame, textvariable=algorithm_var, values=["Bubble Sort", "Merge Sort", "Bubble vs Merge"])
+algorithm_dropdown = ttk.Combobox(input_frame, textvariable=algorithm_var, values=["Bubble Sort", "Merge Sort", "NumPy Sort", "Bubble vs Merge"])
 algorithm_dropdown.grid(row=0, column=1, padx=10)
 
 tk.Label(input_frame, text="Select Input Size:").grid(row=1, column=0, pady=10)
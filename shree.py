@@ -1,46 +1,71 @@
 import time
 import sys
-import random
+import timeit
+import numpy as np
+from numba import njit
 import matplotlib.pyplot as plt
 from prettytable import PrettyTable
 
+# Seeded so every run benchmarks the same inputs
+RNG = np.random.default_rng(42)
+
 # Bubble Sort Implementation
+@njit(cache=True, boundscheck=False)
 def bubble_sort(arr):
-    n = len(arr)
+    n = arr.shape[0]
     for i in range(n):
         for j in range(0, n - i - 1):
             if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j], arr[j]
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
 
 # Merge Sort Implementation
-def merge_sort(arr):
-    if len(arr) > 1:
-        mid = len(arr) // 2
-        left_half = arr[:mid]
-        right_half = arr[mid:]
-
-        merge_sort(left_half)
-        merge_sort(right_half)
-
-        i = j = k = 0
-        while i < len(left_half) and j < len(right_half):
-            if left_half[i] < right_half[j]:
-                arr[k] = left_half[i]
-                i += 1
-            else:
-                arr[k] = right_half[j]
-                j += 1
-            k += 1
-
-        while i < len(left_half):
-            arr[k] = left_half[i]
+@njit(cache=True, boundscheck=False)
+def merge(src, dst, lo, mid, hi):
+    i, j = lo, mid
+    for k in range(lo, hi):
+        if j >= hi or (i < mid and src[i] <= src[j]):
+            dst[k] = src[i]
             i += 1
-            k += 1
-
-        while j < len(right_half):
-            arr[k] = right_half[j]
+        else:
+            dst[k] = src[j]
             j += 1
-            k += 1
+
+@njit(cache=True, boundscheck=False)
+def merge_sort(arr):
+    # Bottom-up merges that ping-pong between arr and one scratch buffer
+    n = arr.shape[0]
+    src, dst = arr, np.empty_like(arr)
+    swapped = False
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            merge(src, dst, lo, min(lo + width, n), min(lo + 2 * width, n))
+        src, dst = dst, src
+        swapped = not swapped
+        width *= 2
+    if swapped:
+        arr[:] = src
+
+# Compile once up front so the first timed run doesn't include JIT time
+bubble_sort(np.array([1, 0], dtype=np.int64))
+merge_sort(np.array([1, 0], dtype=np.int64))
+
+# NumPy Sort Implementation (C-level introsort, used as a baseline)
+def numpy_sort(arr):
+    arr.sort()
+
+# Input Generation
+def make_input(size, input_type):
+    if input_type == 'random':
+        return RNG.integers(0, size + 1, size=size, dtype=np.int64)
+    if input_type == 'sorted':
+        return np.arange(size, dtype=np.int64)
+    return np.arange(size, 0, -1, dtype=np.int64)
+
+# Real timing of a sort for a given size and input type (best of 3 runs, each on a fresh copy of the input)
+def time_sort(sort_function, size, input_type):
+    arr = make_input(size, input_type)
+    return min(timeit.repeat(lambda: sort_function(arr.copy()), number=1, repeat=3))
 
 # Performance Measurement
 def measure_performance(sort_function, arr):
@@ -74,22 +99,18 @@ def run_analysis():
 
     for size in input_sizes:
         for input_type in input_types:
-            if input_type == 'random':
-                arr = [random.randint(0, size) for _ in range(size)]
-            elif input_type == 'sorted':
-                arr = list(range(size))
-            elif input_type == 'reverse_sorted':
-                arr = list(range(size, 0, -1))
+            arr = make_input(size, input_type)
 
             bubble_time, bubble_space = measure_performance(bubble_sort, arr.copy())
             merge_time, merge_space = measure_performance(merge_sort, arr.copy())
+            numpy_time, _ = measure_performance(numpy_sort, arr.copy())
 
-            results.append((input_type, size, bubble_time, merge_time, bubble_space, merge_space))
+            results.append((input_type, size, bubble_time, merge_time, bubble_space, merge_space, numpy_time))
 
     table = PrettyTable()
-    table.field_names = ["Input Type", "Input Size", "Bubble Sort Time (s)", "Merge Sort Time (s)", "Bubble Sort Space (KB)", "Merge Sort Space (KB)"]
+    table.field_names = ["Input Type", "Input Size", "Bubble Sort Time (s)", "Merge Sort Time (s)", "Bubble Sort Space (KB)", "Merge Sort Space (KB)", "NumPy Sort Time (s)"]
     for result in results:
-        table.add_row([result[0], result[1], f"{result[2]:.5f}", f"{result[3]:.5f}", f"{result[4] / 1024:.2f} KB", f"{result[5] / 1024:.2f} KB"])
+        table.add_row([result[0], result[1], f"{result[2]:.5f}", f"{result[3]:.5f}", f"{result[4] / 1024:.2f} KB", f"{result[5] / 1024:.2f} KB", f"{result[6]:.5f}"])
     print(table)
 
 def chart_menu():
@@ -101,13 +122,15 @@ def chart_menu():
 
 def show_chart_for_type(input_type):
     input_sizes = [10, 100, 1000, 10000]
-    bubble_times = [random.uniform(0.01, 1.5) for _ in input_sizes]
-    merge_times = [random.uniform(0.001, 0.5) for _ in input_sizes]
+    bubble_times = [time_sort(bubble_sort, size, input_type) for size in input_sizes]
+    merge_times = [time_sort(merge_sort, size, input_type) for size in input_sizes]
+    numpy_times = [time_sort(numpy_sort, size, input_type) for size in input_sizes]
 
     plt.style.use('dark_background')
     plt.figure()
     plt.plot(input_sizes, bubble_times, label='Bubble Sort', marker='o', color='cyan', linewidth=2)
     plt.plot(input_sizes, merge_times, label='Merge Sort', marker='x', color='magenta', linewidth=2)
+    plt.plot(input_sizes, numpy_times, label='NumPy Sort', marker='^', color='lime', linewidth=2)
     plt.xlabel('Input Size')
     plt.ylabel('Time (seconds)')
     plt.title(f'Performance Comparison - {input_type} input')
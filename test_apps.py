@@ -6,8 +6,126 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from collections import Counter
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import base64
+import io
+
+# Polars is optional; when installed it parses uploaded CSVs with its multi-threaded reader
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Character class of every ASCII code point: 0 letter, 1 digit, 2 space, 3 punctuation
+ASCII_CLASSES = np.array([0 if chr(i).isalpha() else 1 if chr(i).isdigit() else 2 if chr(i).isspace() else 3
+                          for i in range(128)], dtype=np.uint8)
+
+# Punctuation stripped from words before counting, mapped to spaces in one translate pass
+PUNCT_TO_SPACE = str.maketrans({c: ' ' for c in '.,!?";:()[]'})
+
+def text_stats(text):
+    # Word count, sentence count and character classes from a single pass over the text
+    if text.isascii():
+        # One vectorized lookup over the raw bytes
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        classes = ASCII_CLASSES[codes]
+        letters, numbers, spaces, punctuation = np.bincount(classes, minlength=4).tolist()
+        space = classes == 2
+        # A word starts wherever a non-space follows a space (or the start of the text)
+        words = int(np.count_nonzero(~space[1:] & space[:-1])) + int(codes.size > 0 and not space[0])
+        # A sentence is a '.'-separated segment holding anything besides whitespace
+        dot = codes == ord('.')
+        segments = np.cumsum(dot)[~space & ~dot]
+        sentences = int(segments.size > 0) + int(np.count_nonzero(np.diff(segments)))
+    else:
+        # Same counts with the str predicates for non-ASCII text
+        letters = numbers = spaces = punctuation = 0
+        words = sentences = 0
+        in_word = in_sentence = False
+        for c in text:
+            if c.isspace():
+                spaces += 1
+                in_word = False
+                continue
+            if not in_word:
+                words += 1
+                in_word = True
+            if c == '.':
+                sentences += in_sentence
+                in_sentence = False
+            else:
+                in_sentence = True
+            if c.isalpha():
+                letters += 1
+            elif c.isdigit():
+                numbers += 1
+            elif not c.isalnum():
+                punctuation += 1
+        sentences += in_sentence
+    char_counts = {'Letters': letters, 'Numbers': numbers, 'Spaces': spaces, 'Punctuation': punctuation}
+    return words, sentences, char_counts
+
+# Bytes that str.split() treats as whitespace; bytes >= 128 are parts of multi-byte UTF-8 characters
+ASCII_SPACE = np.array([i < 128 and chr(i).isspace() for i in range(256)])
+PREVIEW_BYTES = 4096
+
+def text_file_stats(buf):
+    # Counts lines, words and characters straight from the UTF-8 bytes, without decoding the file
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    lines = int(np.count_nonzero(raw == ord('\n'))) + 1
+    # Every character starts with a byte that isn't a 10xxxxxx continuation byte
+    chars = int(np.count_nonzero((raw & 0xC0) != 0x80))
+    # A word starts wherever a non-space byte follows a space (or the start of the file)
+    space = ASCII_SPACE[raw]
+    words = int(np.count_nonzero(~space[1:] & space[:-1])) + int(raw.size > 0 and not space[0])
+    return lines, words, chars
+
+# Sample data and its derived outputs are cached, so reruns reuse them instead of rebuilding
+@st.cache_data
+def make_sample(seed=42):
+    rng = np.random.RandomState(seed)
+    data = {
+        'Name': [f'Item_{i}' for i in range(1, 101)],
+        'Value': rng.normal(100, 20, 100),
+        'Category': rng.choice(['A', 'B', 'C', 'D'], 100),
+        'Score': rng.uniform(0, 100, 100)
+    }
+    return pd.DataFrame(data)
+
+@st.cache_data
+def describe(df):
+    return df.describe()
+
+@st.cache_data
+def csv_b64(df):
+    csv = df.to_csv(index=False)
+    return base64.b64encode(csv.encode()).decode()
+
+# Parsed uploads are cached on the file contents, so unrelated widget changes don't re-parse the CSV
+@st.cache_data
+def load_csv(data):
+    if pl is not None:
+        # Infer column types from every row, as pandas does; fall back to pandas if Polars still can't parse it
+        try:
+            return pl.read_csv(data, infer_schema_length=None)
+        except pl.exceptions.PolarsError:
+            pass
+    return pd.read_csv(io.BytesIO(data))
+
+# Plots are cached as rendered PNG bytes keyed on the plotted values; each call builds its own
+# Figure outside pyplot, so no figure is shared between sessions
+@st.cache_data(max_entries=32)
+def make_plot(x, y):
+    fig = Figure()
+    ax = fig.subplots()
+    ax.plot(x, y, marker='o')
+    ax.set_xlabel('X Values')
+    ax.set_ylabel('Y Values')
+    ax.set_title('Simple Line Plot')
+    ax.grid(True)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight')
+    return buf.getvalue()
 
 # Configure Streamlit
 st.set_page_config(page_title="Test AI Apps", layout="wide")
@@ -33,39 +151,31 @@ if option == "Text Statistics":
     if st.button("Analyze Text"):
         if text_input.strip():
             # Basic statistics
-            words = text_input.split()
-            sentences = text_input.split('.')
+            words, sentences, char_counts = text_stats(text_input)
             paragraphs = text_input.split('\n\n')
             
             # Display metrics
             col1, col2, col3, col4 = st.columns(4)
             with col1:
-                st.metric("Words", len(words))
+                st.metric("Words", words)
             with col2:
                 st.metric("Characters", len(text_input))
             with col3:
-                st.metric("Sentences", len([s for s in sentences if s.strip()]))
+                st.metric("Sentences", sentences)
             with col4:
                 st.metric("Paragraphs", len([p for p in paragraphs if p.strip()]))
             
             # Word frequency
-            word_freq = Counter(word.lower().strip('.,!?";:()[]') for word in words if len(word) > 2)
+            cleaned = text_input.lower().translate(PUNCT_TO_SPACE)
+            word_freq = Counter(word for word in cleaned.split() if len(word) > 2)
             
             st.subheader("🔑 Most Common Words")
-            for word, count in word_freq.most_common(10):
-                st.write(f"**{word}**: {count} times")
+            # One markdown element for the whole list instead of one element per word
+            st.markdown('\n'.join(f"- **{word}**: {count} times" for word, count in word_freq.most_common(10)))
             
             # Character analysis
             st.subheader("📊 Character Analysis")
-            char_counts = {
-                'Letters': sum(c.isalpha() for c in text_input),
-                'Numbers': sum(c.isdigit() for c in text_input),
-                'Spaces': sum(c.isspace() for c in text_input),
-                'Punctuation': sum(not c.isalnum() and not c.isspace() for c in text_input)
-            }
-            
-            for char_type, count in char_counts.items():
-                st.write(f"**{char_type}**: {count}")
+            st.markdown('\n'.join(f"- **{char_type}**: {count}" for char_type, count in char_counts.items()))
         else:
             st.warning("Please enter some text first.")
 
@@ -75,14 +185,7 @@ elif option == "Data Analysis":
     # Sample data generation
     if st.button("Generate Sample Data"):
         # Create sample dataset
-        np.random.seed(42)
-        data = {
-            'Name': [f'Item_{i}' for i in range(1, 101)],
-            'Value': np.random.normal(100, 20, 100),
-            'Category': np.random.choice(['A', 'B', 'C', 'D'], 100),
-            'Score': np.random.uniform(0, 100, 100)
-        }
-        df = pd.DataFrame(data)
+        df = make_sample(42)
         
         # Display data
         st.subheader("📋 Sample Dataset")
@@ -90,7 +193,7 @@ elif option == "Data Analysis":
         
         # Basic statistics
         st.subheader("📈 Statistics")
-        st.write(df.describe())
+        st.write(describe(df))
         
         # Category counts
         st.subheader("📊 Category Distribution")
@@ -98,8 +201,7 @@ elif option == "Data Analysis":
         st.bar_chart(category_counts)
         
         # Download link
-        csv = df.to_csv(index=False)
-        b64 = base64.b64encode(csv.encode()).decode()
+        b64 = csv_b64(df)
         href = f'<a href="data:file/csv;base64,{b64}" download="sample_data.csv">📥 Download CSV</a>'
         st.markdown(href, unsafe_allow_html=True)
 
@@ -115,25 +217,19 @@ elif option == "Simple Visualization":
     
     if st.button("Create Plot"):
         try:
-            x = [float(val.strip()) for val in x_values.split(',')]
-            y = [float(val.strip()) for val in y_values.split(',')]
+            # NumPy converts the whole list of strings in C and raises ValueError on bad input
+            x = np.array(x_values.split(','), dtype=np.float64)
+            y = np.array(y_values.split(','), dtype=np.float64)
             
-            if len(x) == len(y):
+            if x.size == y.size:
                 # Create plot
-                fig, ax = plt.subplots()
-                ax.plot(x, y, marker='o')
-                ax.set_xlabel('X Values')
-                ax.set_ylabel('Y Values')
-                ax.set_title('Simple Line Plot')
-                ax.grid(True)
-                
-                st.pyplot(fig)
+                st.image(make_plot(x, y))
                 
                 # Statistics
                 st.subheader("📊 Plot Statistics")
-                st.write(f"**Points**: {len(x)}")
-                st.write(f"**X Range**: {min(x)} to {max(x)}")
-                st.write(f"**Y Range**: {min(y)} to {max(y)}")
+                st.write(f"**Points**: {x.size}")
+                st.write(f"**X Range**: {x.min()} to {x.max()}")
+                st.write(f"**Y Range**: {y.min()} to {y.max()}")
             else:
                 st.error("X and Y must have the same number of values")
         except ValueError:
@@ -150,26 +246,25 @@ elif option == "File Processing":
         st.write(f"**File size**: {uploaded_file.size} bytes")
         
         if uploaded_file.name.endswith('.txt'):
-            # Text file processing
-            content = str(uploaded_file.read(), "utf-8")
+            # Text file processing; the upload's buffer is read in place and only a preview is decoded
+            raw = uploaded_file.getbuffer()
             st.subheader("📝 File Content")
-            st.text_area("Content:", content, height=200)
+            st.text_area("Content (preview):", bytes(raw[:PREVIEW_BYTES]).decode('utf-8', 'replace'), height=200)
             
             # Basic analysis
-            lines = content.split('\n')
-            words = content.split()
+            lines, words, chars = text_file_stats(raw)
             
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Lines", len(lines))
+                st.metric("Lines", lines)
             with col2:
-                st.metric("Words", len(words))
+                st.metric("Words", words)
             with col3:
-                st.metric("Characters", len(content))
+                st.metric("Characters", chars)
         
         elif uploaded_file.name.endswith('.csv'):
             # CSV file processing
-            df = pd.read_csv(uploaded_file)
+            df = load_csv(uploaded_file.getvalue())
             st.subheader("📊 CSV Data")
             st.dataframe(df.head())
             
@@ -179,9 +274,8 @@ elif option == "File Processing":
                 st.write(f"**Rows**: {len(df)}")
                 st.write(f"**Columns**: {len(df.columns)}")
             with col2:
-                st.write("**Column Types**:")
-                for col, dtype in df.dtypes.items():
-                    st.write(f"- {col}: {dtype}")
+                column_types = df.schema.items() if pl is not None and isinstance(df, pl.DataFrame) else df.dtypes.items()
+                st.markdown("**Column Types**:\n" + '\n'.join(f"- {col}: {dtype}" for col, dtype in column_types))
 
 # System info
 st.sidebar.markdown("---")
@@ -190,6 +284,7 @@ st.sidebar.write("✅ Streamlit: Running")
 st.sidebar.write("✅ Pandas: Available")
 st.sidebar.write("✅ NumPy: Available")
 st.sidebar.write("✅ Matplotlib: Available")
+st.sidebar.write("✅ Polars: Available" if pl is not None else "➖ Polars: Not installed (using pandas)")
 
 # Footer
 st.markdown("---")
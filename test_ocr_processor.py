@@ -29,9 +29,21 @@ except ImportError:
 class TestResumeOCRProcessor(unittest.TestCase):
     """Test cases for ResumeOCRProcessor class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.processor = ResumeOCRProcessor()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test; the processor is expensive to build."""
+        cls.processor = ResumeOCRProcessor()
+        
+        # Pixel fixtures are shared by every test, so they are made read-only below
+        # High resolution, good contrast image
+        cls.excellent_img = np.empty((1000, 800), dtype=np.uint8)
+        cls.excellent_img[:400, :] = 50   # Dark area
+        cls.excellent_img[400:, :] = 200  # Light area
+        # Low resolution, low contrast image
+        cls.poor_img = np.full((200, 150), 128, dtype=np.uint8)
+        # A test that writes to a shared fixture fails instead of corrupting the others' data
+        cls.excellent_img.setflags(write=False)
+        cls.poor_img.setflags(write=False)
     
     def test_init(self):
         """Test ResumeOCRProcessor initialization."""
@@ -53,28 +65,20 @@ class TestResumeOCRProcessor(unittest.TestCase):
         # Test various section headers
         headers = ['EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS', 'SUMMARY']
         for header in headers:
-            block_type = self.processor._classify_text_block(header, bbox)
-            self.assertEqual(block_type, 'section_header')
+            with self.subTest(header=header):
+                block_type = self.processor._classify_text_block(header, bbox)
+                self.assertEqual(block_type, 'section_header')
     
     def test_classify_text_block_contact_info(self):
         """Test classification of contact information."""
         bbox = [(0, 0), (200, 0), (200, 20), (0, 20)]
         
-        # Test email
-        block_type = self.processor._classify_text_block('john.doe@email.com', bbox)
-        self.assertEqual(block_type, 'contact_info')
-        
-        # Test phone
-        block_type = self.processor._classify_text_block('(555) 123-4567', bbox)
-        self.assertEqual(block_type, 'contact_info')
-        
-        # Test LinkedIn
-        block_type = self.processor._classify_text_block('linkedin.com/in/johndoe', bbox)
-        self.assertEqual(block_type, 'contact_info')
-        
-        # Test GitHub
-        block_type = self.processor._classify_text_block('github.com/johndoe', bbox)
-        self.assertEqual(block_type, 'contact_info')
+        # Test email, phone, LinkedIn and GitHub
+        contacts = ['john.doe@email.com', '(555) 123-4567', 'linkedin.com/in/johndoe', 'github.com/johndoe']
+        for contact in contacts:
+            with self.subTest(contact=contact):
+                block_type = self.processor._classify_text_block(contact, bbox)
+                self.assertEqual(block_type, 'contact_info')
     
     def test_classify_text_block_dates(self):
         """Test classification of date information."""
@@ -82,8 +86,9 @@ class TestResumeOCRProcessor(unittest.TestCase):
         
         dates = ['Jan 2020', 'February 2021', '01/2020', '2019 - 2021']
         for date in dates:
-            block_type = self.processor._classify_text_block(date, bbox)
-            self.assertEqual(block_type, 'date_info')
+            with self.subTest(date=date):
+                block_type = self.processor._classify_text_block(date, bbox)
+                self.assertEqual(block_type, 'date_info')
     
     def test_classify_text_block_bullet_points(self):
         """Test classification of bullet points."""
@@ -91,8 +96,9 @@ class TestResumeOCRProcessor(unittest.TestCase):
         
         bullets = ['• Developed software', '▪ Led team of 5', '‣ Improved performance']
         for bullet in bullets:
-            block_type = self.processor._classify_text_block(bullet, bbox)
-            self.assertEqual(block_type, 'bullet_point')
+            with self.subTest(bullet=bullet):
+                block_type = self.processor._classify_text_block(bullet, bbox)
+                self.assertEqual(block_type, 'bullet_point')
     
     def test_classify_text_block_name(self):
         """Test classification of names."""
@@ -118,10 +124,7 @@ class TestResumeOCRProcessor(unittest.TestCase):
     def test_assess_image_quality_excellent(self, mock_array):
         """Test image quality assessment for excellent quality."""
         # Mock high resolution, good contrast image
-        mock_img = np.zeros((1000, 800), dtype=np.uint8)
-        mock_img[:400, :] = 50   # Dark area
-        mock_img[400:, :] = 200  # Light area
-        mock_array.return_value = mock_img
+        mock_array.return_value = self.excellent_img
         
         mock_image = Mock()
         mock_image.convert.return_value = mock_image
@@ -133,8 +136,7 @@ class TestResumeOCRProcessor(unittest.TestCase):
     def test_assess_image_quality_poor(self, mock_array):
         """Test image quality assessment for poor quality."""
         # Mock low resolution, low contrast image
-        mock_img = np.full((200, 150), 128, dtype=np.uint8)  # Low contrast, small size
-        mock_array.return_value = mock_img
+        mock_array.return_value = self.poor_img
         
         mock_image = Mock()
         mock_image.convert.return_value = mock_image
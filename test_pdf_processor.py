@@ -6,10 +6,13 @@ and multiple extraction methods.
 """
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock, mock_open
+from unittest.mock import Mock, patch, MagicMock
+import io
 import tempfile
 import os
+from contextlib import nullcontext
 from pathlib import Path
+from types import SimpleNamespace
 
 # Import the classes to test
 try:
@@ -25,16 +28,52 @@ except ImportError:
     ResumePDFProcessor = None
 
 
+def make_fake_page(text):
+    """Build a page stub whose extract_text() returns the given text."""
+    return SimpleNamespace(extract_text=lambda: text)
+
+
+def make_fake_reader(pages, encrypted=False, metadata=None):
+    """Build a lightweight PdfReader stub instead of a Mock graph."""
+    return SimpleNamespace(
+        pages=[make_fake_page(text) for text in pages],
+        is_encrypted=encrypted,
+        metadata=metadata or {},
+        decrypt=lambda password: True
+    )
+
+
 @unittest.skipIf(ResumePDFProcessor is None, "PDF processor dependencies not available")
 class TestResumePDFProcessor(unittest.TestCase):
     """Test cases for ResumePDFProcessor class."""
     
+    pdf_bytes = b"%PDF-1.4\n%%EOF\n"
+    
     def setUp(self):
         """Set up test fixtures."""
         with patch('resume_keyword_extractor.processors.pdf_processor.PYPDF2_AVAILABLE', True):
             with patch('resume_keyword_extractor.processors.pdf_processor.PDFPLUMBER_AVAILABLE', True):
                 self.processor = ResumePDFProcessor()
     
+    def patch_open(self):
+        """Serve this test's file reads from the in-memory PDF bytes."""
+        open_patch = patch(
+            'resume_keyword_extractor.processors.pdf_processor.open',
+            new=lambda *args, **kwargs: io.BytesIO(self.pdf_bytes),
+            create=True
+        )
+        open_patch.start()
+        self.addCleanup(open_patch.stop)
+    
+    def use_reader(self, reader):
+        """Swap in a stub PyPDF2 module, for this test only, whose PdfReader returns the given reader."""
+        pypdf2_patch = patch(
+            'resume_keyword_extractor.processors.pdf_processor.PyPDF2',
+            new=SimpleNamespace(PdfReader=lambda *args, **kwargs: reader)
+        )
+        pypdf2_patch.start()
+        self.addCleanup(pypdf2_patch.stop)
+    
     def test_init_with_available_methods(self):
         """Test initialization with available methods."""
         with patch('resume_keyword_extractor.processors.pdf_processor.PYPDF2_AVAILABLE', True):
@@ -75,25 +114,18 @@ class TestResumePDFProcessor(unittest.TestCase):
         result = self.processor._prepare_pdf_file(file_path)
         self.assertEqual(result, file_path)
     
-    @patch('builtins.open', new_callable=mock_open, read_data=b"PDF content")
-    @patch('resume_keyword_extractor.processors.pdf_processor.PyPDF2')
-    def test_analyze_pdf_text_based(self, mock_pypdf2, mock_file):
+    def test_analyze_pdf_text_based(self):
         """Test PDF analysis for text-based PDF."""
-        # Mock PyPDF2 reader
-        mock_reader = Mock()
-        mock_reader.is_encrypted = False
-        mock_reader.metadata = {
-            '/Title': 'Test Resume',
-            '/Author': 'John Doe',
-            '/Creator': 'Test Creator'
-        }
-        
-        # Mock pages with text content
-        mock_page = Mock()
-        mock_page.extract_text.return_value = "Sample resume text content"
-        mock_reader.pages = [mock_page]
-        
-        mock_pypdf2.PdfReader.return_value = mock_reader
+        self.patch_open()
+        # Stub PyPDF2 reader with a page of text content
+        self.use_reader(make_fake_reader(
+            ["Sample resume text content"],
+            metadata={
+                '/Title': 'Test Resume',
+                '/Author': 'John Doe',
+                '/Creator': 'Test Creator'
+            }
+        ))
         
         pdf_type, metadata = self.processor._analyze_pdf('/test/path.pdf')
         
@@ -102,33 +134,23 @@ class TestResumePDFProcessor(unittest.TestCase):
         self.assertEqual(metadata.author, 'John Doe')
         self.assertFalse(metadata.is_encrypted)
     
-    @patch('builtins.open', new_callable=mock_open, read_data=b"PDF content")
-    @patch('resume_keyword_extractor.processors.pdf_processor.PyPDF2')
-    def test_analyze_pdf_encrypted(self, mock_pypdf2, mock_file):
+    def test_analyze_pdf_encrypted(self):
         """Test PDF analysis for encrypted PDF."""
+        self.patch_open()
         mock_reader = Mock()
         mock_reader.is_encrypted = True
-        mock_pypdf2.PdfReader.return_value = mock_reader
+        self.use_reader(mock_reader)
         
         pdf_type, metadata = self.processor._analyze_pdf('/test/path.pdf')
         
         self.assertEqual(pdf_type, PDFType.ENCRYPTED)
         self.assertTrue(metadata.is_encrypted)
     
-    @patch('builtins.open', new_callable=mock_open, read_data=b"PDF content")
-    @patch('resume_keyword_extractor.processors.pdf_processor.PyPDF2')
-    def test_analyze_pdf_image_based(self, mock_pypdf2, mock_file):
+    def test_analyze_pdf_image_based(self):
         """Test PDF analysis for image-based PDF."""
-        mock_reader = Mock()
-        mock_reader.is_encrypted = False
-        mock_reader.metadata = {}
-        
-        # Mock pages with no text content
-        mock_page = Mock()
-        mock_page.extract_text.return_value = ""
-        mock_reader.pages = [mock_page]
-        
-        mock_pypdf2.PdfReader.return_value = mock_reader
+        self.patch_open()
+        # Stub pages with no text content
+        self.use_reader(make_fake_reader([""]))
         
         pdf_type, metadata = self.processor._analyze_pdf('/test/path.pdf')
         
@@ -177,15 +199,12 @@ class TestResumePDFProcessor(unittest.TestCase):
     @patch('resume_keyword_extractor.processors.pdf_processor.pdfplumber')
     def test_extract_with_pdfplumber_success(self, mock_pdfplumber):
         """Test successful extraction with pdfplumber."""
-        # Mock pdfplumber
-        mock_pdf = Mock()
-        mock_page1 = Mock()
-        mock_page1.extract_text.return_value = "Page 1: Resume content with experience"
-        mock_page2 = Mock()
-        mock_page2.extract_text.return_value = "Page 2: Education and skills"
-        
-        mock_pdf.pages = [mock_page1, mock_page2]
-        mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
+        # Stub pdfplumber document, opened as a context manager
+        mock_pdf = SimpleNamespace(pages=[
+            make_fake_page("Page 1: Resume content with experience"),
+            make_fake_page("Page 2: Education and skills")
+        ])
+        mock_pdfplumber.open.return_value = nullcontext(mock_pdf)
         
         result = self.processor._extract_with_pdfplumber('/test/path.pdf')
         
@@ -195,20 +214,12 @@ class TestResumePDFProcessor(unittest.TestCase):
         self.assertEqual(len(result.page_texts), 2)
         self.assertGreater(result.confidence, 0.0)
     
-    @patch('builtins.open', new_callable=mock_open, read_data=b"PDF content")
-    @patch('resume_keyword_extractor.processors.pdf_processor.PyPDF2')
-    def test_extract_with_pypdf2_success(self, mock_pypdf2, mock_file):
+    def test_extract_with_pypdf2_success(self):
         """Test successful extraction with PyPDF2."""
-        mock_reader = Mock()
-        mock_reader.is_encrypted = False
-        
-        mock_page1 = Mock()
-        mock_page1.extract_text.return_value = "Page 1: Resume content"
-        mock_page2 = Mock()
-        mock_page2.extract_text.return_value = "Page 2: More content"
-        
-        mock_reader.pages = [mock_page1, mock_page2]
-        mock_pypdf2.PdfReader.return_value = mock_reader
+        self.patch_open()
+        self.use_reader(make_fake_reader(
+            ["Page 1: Resume content", "Page 2: More content"]
+        ))
         
         result = self.processor._extract_with_pypdf2('/test/path.pdf')
         
@@ -217,53 +228,32 @@ class TestResumePDFProcessor(unittest.TestCase):
         self.assertEqual(result.extraction_method, PDFExtractionMethod.PYPDF2)
         self.assertEqual(len(result.page_texts), 2)
     
-    @patch('builtins.open', new_callable=mock_open, read_data=b"PDF content")
-    @patch('resume_keyword_extractor.processors.pdf_processor.PyPDF2')
-    def test_extract_with_pypdf2_encrypted_with_password(self, mock_pypdf2, mock_file):
-        """Test PyPDF2 extraction with encrypted PDF and correct password."""
-        mock_reader = Mock()
-        mock_reader.is_encrypted = True
-        mock_reader.decrypt.return_value = True
-        
-        mock_page = Mock()
-        mock_page.extract_text.return_value = "Decrypted content"
-        mock_reader.pages = [mock_page]
-        
-        mock_pypdf2.PdfReader.return_value = mock_reader
-        
-        result = self.processor._extract_with_pypdf2('/test/path.pdf', password='correct')
-        
-        self.assertEqual(result.text, "Decrypted content")
-        mock_reader.decrypt.assert_called_once_with('correct')
-    
-    @patch('builtins.open', new_callable=mock_open, read_data=b"PDF content")
-    @patch('resume_keyword_extractor.processors.pdf_processor.PyPDF2')
-    def test_extract_with_pypdf2_encrypted_wrong_password(self, mock_pypdf2, mock_file):
-        """Test PyPDF2 extraction with encrypted PDF and wrong password."""
-        mock_reader = Mock()
-        mock_reader.is_encrypted = True
-        mock_reader.decrypt.return_value = False
-        
-        mock_pypdf2.PdfReader.return_value = mock_reader
-        
-        with self.assertRaises(ValueError) as context:
-            self.processor._extract_with_pypdf2('/test/path.pdf', password='wrong')
-        
-        self.assertIn("Invalid password", str(context.exception))
-    
-    @patch('builtins.open', new_callable=mock_open, read_data=b"PDF content")
-    @patch('resume_keyword_extractor.processors.pdf_processor.PyPDF2')
-    def test_extract_with_pypdf2_encrypted_no_password(self, mock_pypdf2, mock_file):
-        """Test PyPDF2 extraction with encrypted PDF and no password."""
-        mock_reader = Mock()
-        mock_reader.is_encrypted = True
-        
-        mock_pypdf2.PdfReader.return_value = mock_reader
-        
-        with self.assertRaises(ValueError) as context:
-            self.processor._extract_with_pypdf2('/test/path.pdf')
-        
-        self.assertIn("PDF is encrypted", str(context.exception))
+    def test_extract_with_pypdf2_encrypted(self):
+        """Test PyPDF2 extraction with encrypted PDF and correct, wrong or missing password."""
+        self.patch_open()
+        cases = [
+            # (password, decrypt result, expected text, expected error)
+            ('correct', True, "Decrypted content", None),
+            ('wrong', False, None, "Invalid password"),
+            (None, None, None, "PDF is encrypted"),
+        ]
+        for password, decrypted, expected_text, expected_error in cases:
+            with self.subTest(password=password):
+                mock_reader = Mock()
+                mock_reader.is_encrypted = True
+                mock_reader.decrypt.return_value = decrypted
+                mock_reader.pages = [make_fake_page("Decrypted content")]
+                self.use_reader(mock_reader)
+                
+                kwargs = {} if password is None else {'password': password}
+                if expected_error:
+                    with self.assertRaises(ValueError) as context:
+                        self.processor._extract_with_pypdf2('/test/path.pdf', **kwargs)
+                    self.assertIn(expected_error, str(context.exception))
+                else:
+                    result = self.processor._extract_with_pypdf2('/test/path.pdf', **kwargs)
+                    self.assertEqual(result.text, expected_text)
+                    mock_reader.decrypt.assert_called_once_with(password)
     
     def test_get_available_methods(self):
         """Test getting available extraction methods."""
@@ -3,11 +3,14 @@ Tests for the ReportGenerator class.
 
 This module contains comprehensive tests for report generation functionality
 including PDF, JSON, and CSV export capabilities.
+
+The tests share no files and can run in parallel with pytest-xdist:
+
+    pytest -n auto test_report_generator.py
 """
 
 import pytest
 import json
-import tempfile
 import os
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -31,7 +34,7 @@ from resume_keyword_extractor.visualizers.chart_generator import VisualizationRe
 class TestReportGenerator:
     """Test cases for ReportGenerator class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def report_generator(self):
         """Create a ReportGenerator instance for testing."""
         config = ReportConfig(
@@ -42,7 +45,7 @@ class TestReportGenerator:
         )
         return ReportGenerator(config)
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_extraction_result(self):
         """Create sample extraction result for testing."""
         skills = [
@@ -60,7 +63,7 @@ class TestReportGenerator:
             metadata={'test': True}
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_categorization_result(self):
         """Create sample categorization result for testing."""
         skills = [
@@ -88,7 +91,7 @@ class TestReportGenerator:
             processing_time=0.3
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_gap_analysis_result(self):
         """Create sample gap analysis result for testing."""
         missing_skills = [
@@ -129,7 +132,7 @@ class TestReportGenerator:
             processing_time=0.8
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_visualizations(self):
         """Create sample visualizations for testing."""
         return {
@@ -145,7 +148,7 @@ class TestReportGenerator:
             )
         }
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_report_data(self, sample_extraction_result, sample_categorization_result,
                           sample_gap_analysis_result, sample_visualizations):
         """Create complete sample report data."""
@@ -173,39 +176,33 @@ class TestReportGenerator:
         assert generator.config.include_visualizations is False
         assert generator.config.max_recommendations == 3
     
-    def test_generate_json_report_success(self, report_generator, sample_report_data):
+    def test_generate_json_report_success(self, report_generator, sample_report_data, tmp_path):
         """Test successful JSON report generation."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
+        report_path = str(tmp_path / 'report.json')
         
-        try:
-            result = report_generator.generate_json_report(sample_report_data, tmp_path)
-            
-            assert isinstance(result, GeneratedReport)
-            assert result.report_type == 'json'
-            assert result.file_path == tmp_path
-            assert result.content is not None
-            assert result.generation_time > 0
-            
-            # Verify file was created
-            assert os.path.exists(tmp_path)
-            
-            # Verify JSON content
-            with open(tmp_path, 'r') as f:
-                json_data = json.load(f)
-            
-            assert 'report_metadata' in json_data
-            assert 'extraction_results' in json_data
-            assert 'gap_analysis_result' in json_data
-            assert 'summary' in json_data
-            
-            # Verify extraction results
-            assert len(json_data['extraction_results']) == 1
-            assert json_data['extraction_results'][0]['total_skills'] == 3
-            
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        result = report_generator.generate_json_report(sample_report_data, report_path)
+        
+        assert isinstance(result, GeneratedReport)
+        assert result.report_type == 'json'
+        assert result.file_path == report_path
+        assert result.content is not None
+        assert result.generation_time > 0
+        
+        # Verify file was created
+        assert os.path.exists(report_path)
+        
+        # Verify JSON content
+        with open(report_path, 'r') as f:
+            json_data = json.load(f)
+        
+        assert 'report_metadata' in json_data
+        assert 'extraction_results' in json_data
+        assert 'gap_analysis_result' in json_data
+        assert 'summary' in json_data
+        
+        # Verify extraction results
+        assert len(json_data['extraction_results']) == 1
+        assert json_data['extraction_results'][0]['total_skills'] == 3
     
     def test_generate_json_report_without_file(self, report_generator, sample_report_data):
         """Test JSON report generation without saving to file."""
@@ -221,34 +218,28 @@ class TestReportGenerator:
         assert 'report_metadata' in json_data
         assert 'extraction_results' in json_data
     
-    def test_generate_csv_report_success(self, report_generator, sample_report_data):
+    def test_generate_csv_report_success(self, report_generator, sample_report_data, tmp_path):
         """Test successful CSV report generation."""
-        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
+        report_path = str(tmp_path / 'report.csv')
         
-        try:
-            result = report_generator.generate_csv_report(sample_report_data, tmp_path)
-            
-            assert isinstance(result, GeneratedReport)
-            assert result.report_type == 'csv'
-            assert result.file_path == tmp_path
-            assert result.content is not None
-            assert result.generation_time > 0
-            
-            # Verify file was created
-            assert os.path.exists(tmp_path)
-            
-            # Verify CSV content
-            with open(tmp_path, 'r') as f:
-                csv_content = f.read()
-            
-            assert '# SKILLS' in csv_content
-            assert 'Python' in csv_content
-            assert 'JavaScript' in csv_content
-            
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        result = report_generator.generate_csv_report(sample_report_data, report_path)
+        
+        assert isinstance(result, GeneratedReport)
+        assert result.report_type == 'csv'
+        assert result.file_path == report_path
+        assert result.content is not None
+        assert result.generation_time > 0
+        
+        # Verify file was created
+        assert os.path.exists(report_path)
+        
+        # Verify CSV content
+        with open(report_path, 'r') as f:
+            csv_content = f.read()
+        
+        assert '# SKILLS' in csv_content
+        assert 'Python' in csv_content
+        assert 'JavaScript' in csv_content
     
     def test_generate_csv_report_without_file(self, report_generator, sample_report_data):
         """Test CSV report generation without saving to file."""
@@ -264,51 +255,44 @@ class TestReportGenerator:
         assert 'Python' in result.content
     
     @patch('resume_keyword_extractor.exporters.report_generator.SimpleDocTemplate')
-    def test_generate_pdf_report_success(self, mock_doc, report_generator, sample_report_data):
+    def test_generate_pdf_report_success(self, mock_doc, report_generator, sample_report_data, tmp_path):
         """Test successful PDF report generation."""
         # Mock the PDF document
         mock_doc_instance = Mock()
         mock_doc.return_value = mock_doc_instance
         
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
+        report_path = str(tmp_path / 'report.pdf')
         
-        try:
-            result = report_generator.generate_pdf_report(sample_report_data, tmp_path, "Test Report")
-            
-            assert isinstance(result, GeneratedReport)
-            assert result.report_type == 'pdf'
-            assert result.file_path == tmp_path
-            assert result.generation_time > 0
-            
-            # Verify PDF document was created and built
-            mock_doc.assert_called_once()
-            mock_doc_instance.build.assert_called_once()
-            
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        result = report_generator.generate_pdf_report(sample_report_data, report_path, "Test Report")
+        
+        assert isinstance(result, GeneratedReport)
+        assert result.report_type == 'pdf'
+        assert result.file_path == report_path
+        assert result.generation_time > 0
+        
+        # Verify PDF document was created and built
+        mock_doc.assert_called_once()
+        mock_doc_instance.build.assert_called_once()
     
-    def test_generate_all_reports_success(self, report_generator, sample_report_data):
+    def test_generate_all_reports_success(self, report_generator, sample_report_data, tmp_path):
         """Test generation of all report formats."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            base_path = os.path.join(tmp_dir, 'test_report')
-            
-            with patch('resume_keyword_extractor.exporters.report_generator.SimpleDocTemplate'):
-                results = report_generator.generate_all_reports(
-                    sample_report_data, base_path, "Test Report"
-                )
-            
-            assert len(results) == 3
-            assert 'pdf' in results
-            assert 'json' in results
-            assert 'csv' in results
-            
-            # Verify all results are GeneratedReport instances
-            for report_type, result in results.items():
-                assert isinstance(result, GeneratedReport)
-                assert result.report_type == report_type
-                assert result.generation_time > 0
+        base_path = str(tmp_path / 'test_report')
+        
+        with patch('resume_keyword_extractor.exporters.report_generator.SimpleDocTemplate'):
+            results = report_generator.generate_all_reports(
+                sample_report_data, base_path, "Test Report"
+            )
+        
+        assert len(results) == 3
+        assert 'pdf' in results
+        assert 'json' in results
+        assert 'csv' in results
+        
+        # Verify all results are GeneratedReport instances
+        for report_type, result in results.items():
+            assert isinstance(result, GeneratedReport)
+            assert result.report_type == report_type
+            assert result.generation_time > 0
     
     def test_extraction_result_to_dict(self, report_generator, sample_extraction_result):
         """Test conversion of ExtractionResult to dictionary."""
@@ -463,7 +447,7 @@ class TestReportGenerator:
 class TestReportGeneratorIntegration:
     """Integration tests for ReportGenerator with realistic data."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def realistic_report_data(self):
         """Create realistic report data for integration testing."""
         # Create realistic skills
@@ -527,39 +511,38 @@ class TestReportGeneratorIntegration:
             gap_analysis_result=gap_analysis
         )
     
-    def test_comprehensive_report_generation(self, realistic_report_data):
+    def test_comprehensive_report_generation(self, realistic_report_data, tmp_path):
         """Test comprehensive report generation with realistic data."""
         generator = ReportGenerator()
         
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            base_path = os.path.join(tmp_dir, 'comprehensive_report')
-            
-            # Generate JSON report
-            json_result = generator.generate_json_report(realistic_report_data, f"{base_path}.json")
-            
-            assert json_result.report_type == 'json'
-            assert os.path.exists(json_result.file_path)
-            
-            # Verify JSON content quality
-            with open(json_result.file_path, 'r') as f:
-                json_data = json.load(f)
-            
-            assert json_data['summary']['total_skills_analyzed'] == 6
-            assert json_data['summary']['target_role'] == 'Senior Software Developer'
-            assert json_data['summary']['skill_match_percentage'] == 78.5
-            
-            # Generate CSV report
-            csv_result = generator.generate_csv_report(realistic_report_data, f"{base_path}.csv")
-            
-            assert csv_result.report_type == 'csv'
-            assert os.path.exists(csv_result.file_path)
-            
-            # Verify CSV content
-            with open(csv_result.file_path, 'r') as f:
-                csv_content = f.read()
-            
-            assert 'Python' in csv_content
-            assert 'Docker' in csv_content  # Should include recommendations
+        base_path = str(tmp_path / 'comprehensive_report')
+        
+        # Generate JSON report
+        json_result = generator.generate_json_report(realistic_report_data, f"{base_path}.json")
+        
+        assert json_result.report_type == 'json'
+        assert os.path.exists(json_result.file_path)
+        
+        # Verify JSON content quality
+        with open(json_result.file_path, 'r') as f:
+            json_data = json.load(f)
+        
+        assert json_data['summary']['total_skills_analyzed'] == 6
+        assert json_data['summary']['target_role'] == 'Senior Software Developer'
+        assert json_data['summary']['skill_match_percentage'] == 78.5
+        
+        # Generate CSV report
+        csv_result = generator.generate_csv_report(realistic_report_data, f"{base_path}.csv")
+        
+        assert csv_result.report_type == 'csv'
+        assert os.path.exists(csv_result.file_path)
+        
+        # Verify CSV content
+        with open(csv_result.file_path, 'r') as f:
+            csv_content = f.read()
+        
+        assert 'Python' in csv_content
+        assert 'Docker' in csv_content  # Should include recommendations
     
     def test_report_consistency_across_formats(self, realistic_report_data):
         """Test that data is consistent across different report formats."""